@@ -21,6 +21,7 @@
 import java.nio.file.Paths;
 import java.sql.*;
 import java.util.*;
+import java.util.regex.Pattern;
 import java.util.stream.Collectors;
 import java.util.stream.IntStream;
 
@@ -160,6 +161,8 @@ public class Commands {
       "usesLocalFiles",
   };
 
+  private static final Pattern RERUN_OFFSET = Pattern.compile("-?\\d+");
+
   private final SqlLine sqlLine;
   private final ConnectionConfigParser conConfParser;
 
@@ -275,7 +278,7 @@ public void rerun(String line, DispatchCallback callback) {
     String[] cmd = sqlLine.split(line);
     History history = sqlLine.getLineReader().getHistory();
     int size = history.size();
-    if (cmd.length > 2 || (cmd.length == 2 && !cmd[1].matches("-?\\d+"))) {
+    if (!isValidRerun(cmd)) {
       if (size == 0) {
         sqlLine.error("Usage: rerun <offset>, history should not be empty");
       } else {
@@ -318,7 +321,7 @@ private String calculateCommand(int currentOffset, Set<Integer> offsets) {
     String command = iterator.next().line();
     if (command.trim().startsWith("!/") || command.startsWith("!rerun")) {
       String[] cmd = sqlLine.split(command);
-      if (cmd.length > 2 || (cmd.length == 2 && !cmd[1].matches("-?\\d+"))) {
+      if (!isValidRerun(cmd)) {
         return command;
       }
       int offset = cmd.length == 1 ? -1 : Integer.parseInt(cmd[1]);
@@ -330,6 +333,15 @@ private String calculateCommand(int currentOffset, Set<Integer> offsets) {
     return command;
   }
 
+  /**
+   * Returns whether a split rerun command has at most one argument, and
+   * that argument, if present, is an integer offset.
+   */
+  private static boolean isValidRerun(String[] cmd) {
+    return cmd.length < 2
+        || cmd.length == 2 && RERUN_OFFSET.matcher(cmd[1]).matches();
+  }
+
   String arg1(String line, String paramName) {
     return arg1(line, paramName, null);
   }
@@ -1259,7 +1271,9 @@ public void properties(String line, DispatchCallback callback)
 
     for (int i = 1; i < parts.length; i++) {
       Properties props = new Properties();
-      props.load(new FileInputStream(parts[i]));
+      try (InputStream in = new FileInputStream(parts[i])) {
+        props.load(in);
+      }
       connect(props, callback);
       if (callback.isSuccess()) {
         successes++;
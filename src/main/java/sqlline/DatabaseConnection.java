@@ -137,22 +137,26 @@ boolean connect() throws SQLException {
         DatabaseMetaData.class.getClassLoader(),
         new Class[] {DatabaseMetaData.class},
         new DatabaseMetaDataHandler(connection.getMetaData()));
-    try {
-      sqlLine.debug(
-          sqlLine.loc("connected",
-              meta.getDatabaseProductName(),
-              meta.getDatabaseProductVersion()));
-    } catch (Exception e) {
-      sqlLine.handleException(e);
-    }
+    // These messages are only printed in verbose mode; otherwise skip the
+    // product version and driver lookups and building the messages.
+    if (sqlLine.getOpts().getVerbose()) {
+      try {
+        sqlLine.debug(
+            sqlLine.loc("connected",
+                meta.getDatabaseProductName(),
+                meta.getDatabaseProductVersion()));
+      } catch (Exception e) {
+        sqlLine.handleException(e);
+      }
 
-    try {
-      sqlLine.debug(
-          sqlLine.loc("driver",
-              meta.getDriverName(),
-              meta.getDriverVersion()));
-    } catch (Exception e) {
-      sqlLine.handleException(e);
+      try {
+        sqlLine.debug(
+            sqlLine.loc("driver",
+                meta.getDriverName(),
+                meta.getDriverVersion()));
+      } catch (Exception e) {
+        sqlLine.handleException(e);
+      }
     }
 
     try {
@@ -22,7 +22,6 @@
 import java.text.Format;
 import java.text.NumberFormat;
 import java.text.SimpleDateFormat;
-import java.util.Arrays;
 import java.util.Collections;
 import java.util.HashMap;
 import java.util.HashSet;
@@ -227,8 +226,7 @@ class Row {
       sizes = new int[size];
       for (int i = 0; i < size; i++) {
         values[i] = toValue.apply(i + 1);
-        sizes[i] = values[i] == null ? 1 : Arrays.stream(values[i].split("\n"))
-            .map(String::length).max(Integer::compare).orElse(1);
+        sizes[i] = maxLineLength(values[i]);
       }
 
       deleted = false;
@@ -299,8 +297,7 @@ class Row {
             : escapeOutput
                 ? escapeControlSymbols(values[i])
                 : values[i];
-        sizes[i] = values[i] == null ? 1 : Arrays.stream(values[i].split("\n"))
-            .map(String::length).max(Integer::compare).orElse(1);
+        sizes[i] = maxLineLength(values[i]);
       }
     }
 
@@ -315,6 +312,31 @@ private void setFormat(Object o, Format format, int i) {
     }
   }
 
+  /**
+   * Returns the length of the longest line in a value, scanning it once
+   * rather than splitting it into an array of lines.
+   *
+   * @param value Value, possibly containing line breaks
+   *
+   * @return length of the longest line; 1 if value is null or consists
+   * only of line breaks
+   */
+  static int maxLineLength(String value) {
+    if (value == null) {
+      return 1;
+    }
+    int max = 0;
+    int start = 0;
+    int end;
+    while ((end = value.indexOf('\n', start)) >= 0) {
+      max = Math.max(max, end - start);
+      start = end + 1;
+    }
+    max = Math.max(max, value.length() - start);
+    // A value consisting only of line breaks is one column wide
+    return max == 0 && !value.isEmpty() ? 1 : max;
+  }
+
   /**
    * Escapes control symbols (Character.getType(ch) == Character.CONTROL).
    *
@@ -846,11 +846,26 @@ boolean isHelpRequest(String line) {
    * @return true if a comment
    */
   boolean isOneLineComment(String line, boolean trim) {
-    String[] inputLines = line.split("\n");
-    for (String inputLine: inputLines) {
-      if (!isComment(inputLine, trim)) {
+    // Walk the lines in place rather than via line.split("\n"), which is
+    // called on every keystroke by the highlighter. As with split, trailing
+    // empty lines are ignored.
+    int end = line.length();
+    while (end > 0 && line.charAt(end - 1) == '\n') {
+      end--;
+    }
+    if (end == 0) {
+      return !line.isEmpty() || isComment(line, trim);
+    }
+    int start = 0;
+    while (start <= end) {
+      int next = line.indexOf('\n', start);
+      if (next < 0) {
+        next = end;
+      }
+      if (!isComment(line.substring(start, next), trim)) {
         return false;
       }
+      start = next + 1;
     }
     return true;
   }
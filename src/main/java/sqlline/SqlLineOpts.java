@@ -350,9 +350,9 @@ public Properties toProperties(boolean toSave) {
   public void load() throws IOException {
     final File rcFile = new File(getPropertiesFile());
     if (rcFile.exists()) {
-      InputStream in = new FileInputStream(rcFile);
-      load(in);
-      in.close();
+      try (InputStream in = new FileInputStream(rcFile)) {
+        load(in);
+      }
     }
   }
 
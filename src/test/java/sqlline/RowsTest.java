@@ -55,6 +55,17 @@ public void testEscapeControlSymbols() {
     assertThat(Rows.escapeControlSymbols("\\"), is("\\"));
     assertThat(Rows.escapeControlSymbols("\\\\"), is("\\\\"));
   }
+
+  @Test
+  public void testMaxLineLength() {
+    assertThat(Rows.maxLineLength(null), is(1));
+    assertThat(Rows.maxLineLength(""), is(0));
+    assertThat(Rows.maxLineLength("abc"), is(3));
+    assertThat(Rows.maxLineLength("ab\nabcd\na"), is(4));
+    assertThat(Rows.maxLineLength("a\n"), is(1));
+    assertThat(Rows.maxLineLength("\nabc"), is(3));
+    assertThat(Rows.maxLineLength("\n\n"), is(1));
+  }
 }
 
 // End RowsTest.java
@@ -250,11 +250,15 @@ public void testOneLineComment() {
     // one line comments only
     assertTrue(sqlLine.isOneLineComment("-- comment"));
     assertTrue(sqlLine.isOneLineComment("-- comment\n-- comment2"));
+    assertTrue(sqlLine.isOneLineComment("-- comment\n-- comment2\n\n"));
+    assertTrue(sqlLine.isOneLineComment("  -- comment\n  -- comment2"));
 
     // not only one line comments
     assertFalse(sqlLine.isOneLineComment("-- comment\n-- comment2\nselect 1;"));
     assertFalse(sqlLine.isOneLineComment("-- comment\nselect 1-- comment2\n"));
     assertFalse(sqlLine.isOneLineComment("/*comment*/\n-- comment2\n"));
+    assertFalse(sqlLine.isOneLineComment("-- comment\n\n-- comment2"));
+    assertFalse(sqlLine.isOneLineComment(""));
   }
 
   @Test